@@ -1,10 +1,24 @@
 import pandas as pd
+import pytest
 from pathlib import Path
 
 from src.core.data_loader import DataLoader
 from src.core.feature_engineer import FeatureEngineer
 from src.core.forecaster import Forecaster
 
+
+@pytest.fixture(scope="session")
+def prepared_features():
+    """load data and create features once for the whole test session."""
+    loader = DataLoader()
+    df = loader.load_and_prepare_data()
+
+    engineer = FeatureEngineer()
+    df_feat, feature_cols = engineer.create_features(df)
+
+    return df, df_feat, feature_cols
+
+
 def test_data_quality():
     dengue_path = Path("data/infodengue_capitals_subsetBR.csv")
     sst_path = Path("data/sst_indices.csv")
@@ -12,43 +26,37 @@ def test_data_quality():
     assert dengue_path.exists(), f"Missing dengue dataset: {dengue_path}"
     assert sst_path.exists(), f"Missing SST dataset: {sst_path}"
 
-    dengue_df = pd.read_csv(dengue_path)
-    sst_df = pd.read_csv(sst_path)
+    # only the header is needed to check the schema
+    dengue_cols = set(pd.read_csv(dengue_path, nrows=0).columns)
+    sst_cols = set(pd.read_csv(sst_path, nrows=0).columns)
 
     dengue_required = {"data_iniSE", "casos_est"}
     sst_required = {"YR", "MON", "NINO1+2", "NINO3", "NINO3.4", "ANOM.3"}
 
-    missing_dengue = dengue_required - set(dengue_df.columns)
-    missing_sst = sst_required - set(sst_df.columns)
+    missing_dengue = dengue_required - dengue_cols
+    missing_sst = sst_required - sst_cols
 
     assert not missing_dengue, f"[dengue] Missing columns: {sorted(missing_dengue)}"
     assert not missing_sst, f"[sst] Missing columns: {sorted(missing_sst)}"
 
 
-def test_features_exist_and_not_all_nan():
-    loader = DataLoader()
-    df = loader.load_and_prepare_data()
-
-    engineer = FeatureEngineer()
-    df_feat, feature_cols = engineer.create_features(df)
+def test_features_exist_and_not_all_nan(prepared_features):
+    _, df_feat, feature_cols = prepared_features
 
     assert feature_cols, "No feature columns returned by FeatureEngineer"
 
     missing = [c for c in feature_cols if c not in df_feat.columns]
     assert not missing, f"Missing engineered features: {missing}"
 
-    all_nan = [c for c in feature_cols if df_feat[c].isna().all()]
+    all_nan_mask = df_feat[feature_cols].isna().all(axis=0).to_numpy()
+    all_nan = [c for c, is_nan in zip(feature_cols, all_nan_mask) if is_nan]
     assert not all_nan, f"All-NaN feature columns: {all_nan}"
 
 
-def test_forecast_shape():
-    loader = DataLoader()
-    df = loader.load_and_prepare_data()
-
-    engineer = FeatureEngineer()
-    df_feat, feature_cols = engineer.create_features(df)
+def test_forecast_shape(prepared_features):
+    _, df_feat, feature_cols = prepared_features
 
-    forecaster = Forecaster(engineer)
+    forecaster = Forecaster(FeatureEngineer())
 
     from src.core.model_trainer import ModelTrainer
     trainer = ModelTrainer()
@@ -32,10 +32,13 @@ class DataLoader:
         returns:
             processed dengue dataframe with date and quarter columns
         """
-        df = pd.read_csv(self.dengue_path)
+        # only the date and target columns are used downstream
+        df = pd.read_csv(
+            self.dengue_path,
+            usecols=['data_iniSE', 'casos_est'],
+            parse_dates=['data_iniSE']
+        )
         
-        # parse dates
-        df['data_iniSE'] = pd.to_datetime(df['data_iniSE'])
         df['year'] = df['data_iniSE'].dt.year
         df['quarter'] = df['data_iniSE'].dt.quarter
         df['year_quarter'] = df['year'].astype(str) + '-Q' + df['quarter'].astype(str)
@@ -49,7 +52,10 @@ class DataLoader:
         returns:
             processed sst dataframe with date and quarter columns
         """
-        df = pd.read_csv(self.sst_path)
+        df = pd.read_csv(
+            self.sst_path,
+            usecols=['YR', 'MON', 'NINO1+2', 'NINO3', 'NINO3.4', 'ANOM.3']
+        )
         
         # parse dates
         df['date'] = pd.to_datetime(
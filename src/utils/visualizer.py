@@ -4,9 +4,55 @@ handles plotting of predictions, comparisons, and trends.
 """
 
 import os
+import re
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-from typing import Optional
+from functools import lru_cache
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from typing import Optional, Tuple
+
+
+# characters not allowed in plot filenames, replaced one-for-one by '_'
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w-]')
+
+
+@lru_cache(maxsize=64)
+def _safe_filename(title: str) -> str:
+    """
+    turn a plot title into a filesystem-safe filename stem.
+    
+    args:
+        title: plot title
+        
+    returns:
+        lowercased title with unsafe characters replaced by '_'
+    """
+    return _UNSAFE_FILENAME_CHARS.sub('_', title.strip().lower())
+
+
+@lru_cache(maxsize=4)
+def _quarter_dates(year_quarters: Tuple[str, ...]) -> pd.DatetimeIndex:
+    """
+    convert year_quarter labels to quarter start timestamps.
+    cached so repeated plots of the same history skip the conversion.
+    
+    args:
+        year_quarters: tuple of year_quarter labels (e.g. '2023-Q1')
+        
+    returns:
+        datetime index with the start date of each quarter
+    """
+    labels = pd.Index(year_quarters, dtype=str)
+    years = labels.str[:4].astype(int).to_numpy()
+    quarters = labels.str[-1:].astype(int).to_numpy()
+    
+    # months since epoch of each quarter start, avoiding Period objects
+    months = (years - 1970) * 12 + (quarters - 1) * 3
+    return pd.DatetimeIndex(
+        months.astype('datetime64[M]').astype('datetime64[ns]')
+    )
 
 
 class Visualizer:
@@ -26,11 +72,42 @@ class Visualizer:
         self.figsize = figsize
         self.show_plots = show_plots
         self.output_dir = os.path.join("outputs", "plots")
+        self._created_dir = None
+        
+        # fixed margins for time series plots, cheaper than tight_layout
+        self._layout = dict(left=0.08, right=0.97, top=0.92, bottom=0.18)
+        
+        # headless figure reused across plots; a bare Figure renders with
+        # the agg canvas and never touches the interactive pyplot backend
+        self._fig = Figure(figsize=figsize)
     
-    def _save_fig(self, filename: str) -> None:
-        os.makedirs(self.output_dir, exist_ok=True)
+    def _get_axes(self, figsize: tuple) -> Tuple[Figure, Axes]:
+        """
+        get a figure and axes ready for a new plot.
+        
+        args:
+            figsize: figure size for the plot
+            
+        returns:
+            tuple of (figure, axes)
+        """
+        if self.show_plots:
+            return plt.subplots(figsize=figsize)
+        
+        # clear the whole figure so no axis state leaks between plots
+        self._fig.clear()
+        self._fig.set_size_inches(figsize)
+        return self._fig, self._fig.add_subplot()
+    
+    def _save_fig(self, fig: Figure, filename: str) -> None:
+        # create the output directory once rather than on every save
+        if self._created_dir != self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._created_dir = self.output_dir
         path = os.path.join(self.output_dir, filename)
-        plt.savefig(path, dpi=150, bbox_inches="tight")
+        # layout is fixed before saving, so skip the extra render pass
+        # that bbox_inches="tight" would cost
+        fig.savefig(path, dpi=100)
     
     def add_quarter_date(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -42,11 +119,8 @@ class Visualizer:
         returns:
             dataframe with added date column
         """
-        df_copy = df.copy()
-        df_copy['date'] = pd.PeriodIndex(
-            df_copy['year_quarter'], freq='Q'
-        ).to_timestamp()
-        return df_copy
+        dates = _quarter_dates(tuple(df['year_quarter']))
+        return df.assign(date=dates)
     
     def plot_actual_vs_predicted(
         self,
@@ -69,18 +143,17 @@ class Visualizer:
             hist_years: number of historical years to show
         """
         # prepare test data
-        plot_df = self.add_quarter_date(test_df.copy())
+        plot_df = self.add_quarter_date(test_df)
         plot_df['predicted'] = predictions
         
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax = self._get_axes(self.figsize)
         
         # plot historical context if provided
         if historical_df is not None:
-            hist_df = self.add_quarter_date(historical_df.copy())
-            train_hist = hist_df[
-                (hist_df['year'] <= year - 1) & 
-                (hist_df['year'] >= year - hist_years)
-            ]
+            hist_df = self.add_quarter_date(historical_df)
+            hist_year = hist_df['year'].to_numpy()
+            mask = (hist_year <= year - 1) & (hist_year >= year - hist_years)
+            train_hist = hist_df.iloc[mask]
             ax.plot(
                 train_hist['date'],
                 train_hist['casos_est'],
@@ -126,13 +199,11 @@ class Visualizer:
         ax.set_ylabel('Quarterly Cases')
         ax.legend()
         ax.grid(alpha=0.3)
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        self._save_fig(f"actual_vs_predicted_{year}_{model_name}.png")
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.subplots_adjust(**self._layout)
+        self._save_fig(fig, f"actual_vs_predicted_{year}_{model_name}.png")
         if self.show_plots:
             plt.show()
-        else:
-            plt.close()
     
     def plot_forecast(
         self,
@@ -153,30 +224,27 @@ class Visualizer:
             hist_start_year: starting year for historical plot
         """
         # prepare data
-        forecast_plot = self.add_quarter_date(forecast_df.copy())
-        hist_plot = self.add_quarter_date(historical_df.copy())
+        forecast_plot = self.add_quarter_date(forecast_df)
+        hist_plot = self.add_quarter_date(historical_df)
         
         # filter historical data
         if hist_start_year:
-            hist = hist_plot[hist_plot['year'] >= hist_start_year].copy()
+            hist = hist_plot.iloc[hist_plot['year'].to_numpy() >= hist_start_year]
         else:
-            hist = hist_plot.copy()
+            hist = hist_plot
         
-        # get last historical point for connection
-        last_hist_date = hist['date'].iloc[-1]
-        last_hist_value = hist['casos_est'].iloc[-1]
-        
-        # create connected forecast
-        forecast_connected = pd.concat([
-            pd.DataFrame({
-                'date': [last_hist_date],
-                'predicted_casos_est': [last_hist_value]
-            }),
-            forecast_plot[['date', 'predicted_casos_est']]
-        ], ignore_index=True)
+        # prepend last historical point to connect the forecast line
+        connected_dates = np.concatenate([
+            hist['date'].to_numpy()[-1:],
+            forecast_plot['date'].to_numpy()
+        ])
+        connected_values = np.concatenate([
+            hist['casos_est'].to_numpy()[-1:],
+            forecast_plot['predicted_casos_est'].to_numpy()
+        ])
         
         # create plot
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax = self._get_axes(self.figsize)
         
         # plot historical
         ax.plot(
@@ -189,8 +257,8 @@ class Visualizer:
         
         # plot forecast
         ax.plot(
-            forecast_connected['date'],
-            forecast_connected['predicted_casos_est'],
+            connected_dates,
+            connected_values,
             'r--o',
             linewidth=2.5,
             markersize=8,
@@ -216,13 +284,11 @@ class Visualizer:
         ax.set_ylabel('Quarterly Cases')
         ax.grid(alpha=0.3)
         ax.legend()
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        self._save_fig(f"forecast_{forecast_year}_{model_name}.png")
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.subplots_adjust(**self._layout)
+        self._save_fig(fig, f"forecast_{forecast_year}_{model_name}.png")
         if self.show_plots:
             plt.show()
-        else:
-            plt.close()
     
     def plot_feature_importance(
         self,
@@ -236,7 +302,7 @@ class Visualizer:
             importance_df: dataframe with Feature and Importance columns
             title: plot title
         """
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._get_axes((10, 6))
         
         # create horizontal bar chart
         ax.barh(
@@ -250,16 +316,10 @@ class Visualizer:
         ax.set_title(title, fontsize=14, fontweight='bold')
         ax.invert_yaxis()  # highest importance on top
         ax.grid(alpha=0.3, axis='x')
-        plt.tight_layout()
-        safe_title = "".join(
-            c if c.isalnum() or c in ("-", "_") else "_"
-            for c in title.strip().lower()
-        )
-        self._save_fig(f"feature_importance_{safe_title}.png")
+        fig.tight_layout()
+        self._save_fig(fig, f"feature_importance_{_safe_filename(title)}.png")
         if self.show_plots:
             plt.show()
-        else:
-            plt.close()
     
     def print_feature_importance(
         self,
@@ -277,10 +337,14 @@ class Visualizer:
         print(f"[SEARCH] {title}")
         print("=" * 80)
         
-        for _, row in importance_df.iterrows():
-            bar = '' * int(row['Importance'] * 50)
-            print(
-                f"   {row['Feature']:<25} "
-                f"{row['Importance']:.4f} {bar}"
-            )
+        features = importance_df['Feature'].astype(str).to_numpy()
+        importances = importance_df['Importance'].to_numpy()
+        widths = (importances * 50).astype(int)
+        
+        lines = [
+            f"   {feature:<25} {importance:.4f} {'' * width}"
+            for feature, importance, width in zip(features, importances, widths)
+        ]
+        if lines:
+            print("\n".join(lines))
     
\ No newline at end of file